@@ -2,9 +2,13 @@
 Audio playback functionality with multiple backend support.
 """
 
+import asyncio
+import io
 import os
+import importlib.util
 import tempfile
 import platform
+import time
 from typing import Optional
 from pathlib import Path
 
@@ -14,6 +18,10 @@ class AudioError(Exception):
     pass
 
 
+# Poll step while the mixer drains its last buffer after a pygame clip ends
+_DRAIN_POLL_MS = 100
+
+
 class AudioPlayer:
     """
     Cross-platform audio player with multiple backend support.
@@ -21,6 +29,9 @@ class AudioPlayer:
     Supports pygame and playsound libraries with automatic fallback.
     """
     
+    # Backend detection result shared by all instances
+    _cached_backends: Optional[list] = None
+    
     def __init__(self, preferred_backend: Optional[str] = None):
         """
         Initialize AudioPlayer with optional backend preference.
@@ -30,67 +41,113 @@ class AudioPlayer:
         """
         self.preferred_backend = preferred_backend
         self._pygame_initialized = False
+        self._pygame_mod = None
         self._available_backends = self._detect_backends()
         
         if not self._available_backends:
             raise AudioError("No audio backends available. Please install pygame or playsound.")
     
-    def _detect_backends(self) -> list:
+    @classmethod
+    def _detect_backends(cls) -> list:
         """
         Detect available audio backends.
         
+        The result is cached at class level; use flush_backend_cache()
+        to force a fresh probe.
+        
         Returns:
             List of available backend names
         """
+        if cls._cached_backends is not None:
+            return cls._cached_backends
+        
         backends = []
         
-        # Check for pygame
-        try:
-            import pygame
+        # Probe with find_spec so the backend modules are not imported
+        # (and pygame's mixer is not touched) until playback is requested
+        if importlib.util.find_spec('pygame') is not None:
             backends.append('pygame')
-        except ImportError:
-            pass
         
-        # Check for playsound
-        try:
-            import playsound
+        if importlib.util.find_spec('playsound') is not None:
             backends.append('playsound')
-        except ImportError:
-            pass
         
+        cls._cached_backends = backends
         return backends
     
+    @classmethod
+    def flush_backend_cache(cls) -> None:
+        """Discard cached backend detection so the next instance re-probes."""
+        cls._cached_backends = None
+    
+    def _get_pygame(self):
+        """Import pygame on first use and cache the module."""
+        if self._pygame_mod is None:
+            import pygame
+            self._pygame_mod = pygame
+        return self._pygame_mod
+    
     def _init_pygame(self):
         """Initialize pygame mixer if not already initialized."""
         if not self._pygame_initialized:
             try:
-                import pygame
-                pygame.mixer.init()
+                pygame = self._get_pygame()
+                if pygame.mixer.get_init() is None:
+                    pygame.mixer.init()
                 self._pygame_initialized = True
             except Exception as e:
                 raise AudioError(f"Failed to initialize pygame: {str(e)}")
     
-    def _play_with_pygame(self, filename: str) -> None:
+    def _play_with_pygame_file(self, filename: str) -> None:
         """
         Play audio file using pygame.
         
         Args:
             filename: Path to audio file
             
+        Raises:
+            AudioError: If playback fails
+        """
+        self._play_with_pygame(filename)
+    
+    def _play_with_pygame_bytes(self, audio_data: bytes) -> None:
+        """
+        Play in-memory audio data using pygame, without a temporary file.
+        
+        Args:
+            audio_data: Audio data as bytes
+            
+        Raises:
+            AudioError: If playback fails
+        """
+        self._play_with_pygame(io.BytesIO(audio_data))
+    
+    def _play_with_pygame(self, source) -> None:
+        """
+        Play a filename or file-like object using pygame.
+        
+        Args:
+            source: Path to audio file or readable binary file object
+            
         Raises:
             AudioError: If playback fails
         """
         try:
-            import pygame
             self._init_pygame()
+            pygame = self._pygame_mod
             
             # Load and play the sound
-            sound = pygame.mixer.Sound(filename)
-            sound.play()
+            sound = pygame.mixer.Sound(file=source)
+            length_ms = int(sound.get_length() * 1000)
+            started = time.monotonic()
+            channel = sound.play()
+            if channel is None:
+                return  # No free mixer channel, so nothing is playing
             
-            # Wait for playback to complete
-            while pygame.mixer.get_busy():
-                pygame.time.wait(100)
+            # Sleep for whatever is left of the clip in one go, then wait out
+            # the mixer's last buffer instead of polling throughout
+            while channel.get_busy():
+                remaining_ms = length_ms - int((time.monotonic() - started) * 1000)
+                pygame.time.wait(max(remaining_ms, _DRAIN_POLL_MS))
                 
         except Exception as e:
             raise AudioError(f"Pygame playback failed: {str(e)}")
@@ -153,7 +210,7 @@ class AudioPlayer:
         
         try:
             if backend == 'pygame':
-                self._play_with_pygame(filename)
+                self._play_with_pygame_file(filename)
             elif backend == 'playsound':
                 self._play_with_playsound(filename)
             else:
@@ -165,13 +222,29 @@ class AudioPlayer:
                 try:
                     fallback = fallback_backends[0]
                     if fallback == 'pygame':
-                        self._play_with_pygame(filename)
+                        self._play_with_pygame_file(filename)
                     elif fallback == 'playsound':
                         self._play_with_playsound(filename)
                 except Exception:
                     pass  # Fallback failed, re-raise original error
             raise
     
+    async def play_file_async(self, filename: str) -> None:
+        """
+        Play audio file without blocking the event loop.
+        
+        Playback runs in the default executor so other coroutines (e.g.
+        synthesis of the next utterance) can proceed meanwhile.
+        
+        Args:
+            filename: Path to audio file to play
+            
+        Raises:
+            AudioError: If file doesn't exist or playback fails
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.play_file, filename)
+    
     def play_audio_data(self, audio_data: bytes, format_hint: str = "mp3") -> None:
         """
         Play audio from bytes data.
@@ -186,6 +259,14 @@ class AudioPlayer:
         if not audio_data:
             raise AudioError("No audio data provided")
         
+        # pygame decodes straight from memory; only playsound needs a real file
+        if self._get_backend_to_use() == 'pygame':
+            try:
+                self._play_with_pygame_bytes(audio_data)
+                return
+            except AudioError:
+                pass  # Retry through a temporary file and the fallback backends
+        
         # Create temporary file for playback
         try:
             with tempfile.NamedTemporaryFile(suffix=f".{format_hint}", delete=False) as temp_file:
@@ -230,8 +311,7 @@ class AudioPlayer:
         """Clean up audio resources."""
         if self._pygame_initialized:
             try:
-                import pygame
-                pygame.mixer.quit()
+                self._pygame_mod.mixer.quit()
                 self._pygame_initialized = False
             except Exception:
                 pass  # Ignore cleanup errors
\ No newline at end of file
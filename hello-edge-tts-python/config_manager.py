@@ -5,10 +5,42 @@ Configuration management for TTS client.
 import json
 import yaml
 import os
-from dataclasses import dataclass, asdict
-from typing import Optional, Dict, Any
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Callable, Optional, Dict, Any, FrozenSet, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib json module
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+
+@lru_cache(maxsize=None)
+def _config_fields(cls: type) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    """Field names of a TTSConfig (sub)class, in order and as a set, computed once per class."""
+    names = tuple(field.name for field in fields(cls))
+    return names, frozenset(names)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, indent: int = 2) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it supports the indent."""
+    if orjson is not None and indent == 2:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=indent, ensure_ascii=False).encode('utf-8')
+
 
 @dataclass
 class TTSConfig:
@@ -47,16 +79,16 @@ class TTSConfig:
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'TTSConfig':
         """Create TTSConfig from dictionary."""
         # Filter out unknown keys
-        valid_keys = {field.name for field in cls.__dataclass_fields__.values()}
-        filtered_dict = {k: v for k, v in config_dict.items() if k in valid_keys}
+        field_set = _config_fields(cls)[1]
+        filtered_dict = {k: v for k, v in config_dict.items() if k in field_set}
         return cls(**filtered_dict)
     
     @classmethod
     def from_json_file(cls, file_path: str) -> 'TTSConfig':
         """Load configuration from JSON file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                config_dict = json.load(f)
+            with open(file_path, 'rb') as f:
+                config_dict = _json_loads(f.read())
             return cls.from_dict(config_dict)
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
@@ -68,7 +100,7 @@ class TTSConfig:
         """Load configuration from YAML file."""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                config_dict = yaml.safe_load(f)
+                config_dict = yaml.load(f, Loader=YamlLoader)
             return cls.from_dict(config_dict or {})
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
@@ -88,19 +120,20 @@ class TTSConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert TTSConfig to dictionary."""
-        return asdict(self)
+        # Fields are flat scalars, so no deep copy (as asdict does) is needed
+        return {name: getattr(self, name) for name in _config_fields(type(self))[0]}
     
     def to_json_file(self, file_path: str, indent: int = 2) -> None:
         """Save configuration to JSON file."""
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=indent)
+        with open(file_path, 'wb') as f:
+            f.write(_json_dumps(self.to_dict(), indent))
     
     def to_yaml_file(self, file_path: str) -> None:
         """Save configuration to YAML file."""
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         with open(file_path, 'w', encoding='utf-8') as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False, indent=2)
+            yaml.dump(self.to_dict(), f, Dumper=YamlDumper, default_flow_style=False, indent=2)
     
     def to_file(self, file_path: str) -> None:
         """Save configuration to file (auto-detect format)."""
@@ -123,34 +156,35 @@ class ConfigManager:
         "~/.tts/config.yaml"
     ]
     
-    PRESETS = {
-        "default": TTSConfig(),
-        "fast": TTSConfig(
+    # Presets are factories so no TTSConfig is built until one is requested
+    PRESETS: Dict[str, Callable[[], TTSConfig]] = {
+        "default": TTSConfig,
+        "fast": lambda: TTSConfig(
             rate="+20%",
             max_concurrent=5,
             batch_size=10
         ),
-        "slow": TTSConfig(
+        "slow": lambda: TTSConfig(
             rate="-20%",
             max_concurrent=2,
             batch_size=3
         ),
-        "high_quality": TTSConfig(
+        "high_quality": lambda: TTSConfig(
             output_format="wav",
             cache_voices=True,
             max_retries=5
         ),
-        "batch_processing": TTSConfig(
+        "batch_processing": lambda: TTSConfig(
             max_concurrent=8,
             batch_size=20,
             cache_voices=True
         ),
-        "whisper": TTSConfig(
+        "whisper": lambda: TTSConfig(
             rate="-10%",
             volume="50%",
             pitch="-5%"
         ),
-        "excited": TTSConfig(
+        "excited": lambda: TTSConfig(
             rate="+15%",
             pitch="+10%",
             volume="110%"
@@ -178,7 +212,13 @@ class ConfigManager:
         if preset_name not in cls.PRESETS:
             available = ', '.join(cls.PRESETS.keys())
             raise ValueError(f"Unknown preset '{preset_name}'. Available: {available}")
-        return cls.PRESETS[preset_name]
+        return cls._materialize(preset_name)
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _materialize(cls, preset_name: str) -> TTSConfig:
+        """Build a preset configuration once and reuse it."""
+        return cls.PRESETS[preset_name]()
     
     @classmethod
     def list_presets(cls) -> list[str]:
@@ -9,11 +9,13 @@ Microsoft Edge TTS service.
 import asyncio
 import argparse
 import os
+import sys
 import time
 from pathlib import Path
 
 from tts_client import TTSClient, TTSError
 from audio_player import AudioPlayer, AudioError
+from ssml_utils import extract_language, wrap_speak
 from utils import create_output_directory, get_safe_filename
 
 
@@ -53,8 +55,10 @@ async def main():
             print(f"{'Name':<35} {'Display Name':<20} {'Locale':<10} {'Gender'}")
             print("-" * 80)
             
-            for voice in voices[:20]:  # Show first 20 voices
-                print(f"{voice.name:<35} {voice.display_name:<20} {voice.locale:<10} {voice.gender}")
+            # Build the table and emit it in a single write
+            rows = [f"{voice.name:<35} {voice.display_name:<20} {voice.locale:<10} {voice.gender}\n"
+                    for voice in voices[:20]]  # Show first 20 voices
+            sys.stdout.write("".join(rows))
             
             if len(voices) > 20:
                 print(f"... and {len(voices) - 20} more voices")
@@ -74,8 +78,9 @@ async def main():
             print(f"{'Name':<35} {'Display Name':<20} {'Locale':<10} {'Gender'}")
             print("-" * 80)
             
-            for voice in voices:
-                print(f"{voice.name:<35} {voice.display_name:<20} {voice.locale:<10} {voice.gender}")
+            rows = [f"{voice.name:<35} {voice.display_name:<20} {voice.locale:<10} {voice.gender}\n"
+                    for voice in voices]
+            sys.stdout.write("".join(rows))
             return
         
         # Run demonstrations if requested
@@ -87,11 +92,6 @@ async def main():
             elif args.demo == "voices":
                 await demo_voices(client)
             return
-            
-            if len(voices) > 20:
-                print(f"... and {len(voices) - 20} more voices")
-            
-            return
         
         # Create output directory
         output_dir = "output"
@@ -125,7 +125,7 @@ async def main():
             try:
                 print("Playing audio...")
                 player = AudioPlayer()
-                player.play_file(output_file)
+                await player.play_file_async(output_file)
                 print("Playback completed!")
             except AudioError as e:
                 print(f"Could not play audio: {e}")
@@ -146,23 +146,29 @@ async def main():
     return 0
 
 
-async def demo_ssml(client):
+# (ssml, filename) pairs used by demo_ssml, built once at import
+# (SSML body, output filename) pairs; demo_ssml wraps each body in the
+# <speak>/<voice> elements for the chosen voice
+SSML_DEMO_EXAMPLES = (
+    ('<prosody rate="slow">This is spoken slowly.</prosody>', "edgetts_ssml_slow_python.mp3"),
+    ('<prosody pitch="high">This is high pitch.</prosody>', "edgetts_ssml_pitch_python.mp3"),
+    ('This is <emphasis level="strong">strongly emphasized</emphasis> text.', "edgetts_ssml_emphasis_python.mp3"),
+    ('First sentence.<break time="2s"/>After a long pause.', "edgetts_ssml_break_python.mp3")
+)
+
+
+async def demo_ssml(client, voice: str = "en-US-AriaNeural"):
     """Demonstrate SSML functionality."""
     print("=== SSML Demonstration ===")
     
-    ssml_examples = [
-        ('<speak><prosody rate="slow">This is spoken slowly.</prosody></speak>', "edgetts_ssml_slow_python.mp3"),
-        ('<speak><prosody pitch="high">This is high pitch.</prosody></speak>', "edgetts_ssml_pitch_python.mp3"),
-        ('<speak>This is <emphasis level="strong">strongly emphasized</emphasis> text.</speak>', "edgetts_ssml_emphasis_python.mp3"),
-        ('<speak>First sentence.<break time="2s"/>After a long pause.</speak>', "edgetts_ssml_break_python.mp3")
-    ]
-    
-    for ssml, filename in ssml_examples:
+    lang = extract_language(voice)
+    for body, filename in SSML_DEMO_EXAMPLES:
+        ssml = wrap_speak(body, voice, lang)
         print(f"Generating: {filename}")
         print(f"SSML: {ssml}")
         
         try:
-            audio_data = await client.synthesize_ssml(ssml)
+            audio_data = await client.synthesize_ssml(ssml, voice)
             await client.save_audio(audio_data, f"output/{filename}")
             print(f"Saved: output/{filename}\n")
         except Exception as e:
@@ -182,16 +188,26 @@ async def demo_batch(client):
     
     voice = "en-US-AriaNeural"
     
-    print("Processing texts sequentially...")
-    for i, text in enumerate(texts, 1):
-        print(f"Processing text {i}: {text[:30]}...")
-        try:
+    max_concurrent = client.config.max_concurrent
+    semaphore = asyncio.Semaphore(max_concurrent)
+    
+    async def process_text(i, text):
+        async with semaphore:
+            print(f"Processing text {i}: {text[:30]}...")
             audio_data = await client.synthesize_text(text, voice)
             filename = f"output/edgetts_batch_{i}_python.mp3"
             await client.save_audio(audio_data, filename)
-            print(f"Saved: {filename}")
-        except Exception as e:
-            print(f"Error processing text {i}: {e}")
+            return filename
+    
+    print(f"Processing texts concurrently (up to {max_concurrent} at a time)...")
+    tasks = [asyncio.create_task(process_text(i, text)) for i, text in enumerate(texts, 1)]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    for i, result in enumerate(results, 1):
+        if isinstance(result, Exception):
+            print(f"Error processing text {i}: {result}")
+        else:
+            print(f"Saved: {result}")
     
     print("Batch processing completed!")
 
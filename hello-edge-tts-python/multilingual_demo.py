@@ -5,10 +5,12 @@ Generates audio files for 12 languages with specified sentences.
 """
 
 import asyncio
+import itertools
 import json
 import os
 import time
 from pathlib import Path
+from typing import Iterator, List, Optional
 import sys
 
 # Add the parent directory to Python path to import local modules
@@ -33,8 +35,19 @@ async def load_language_config():
         return None
 
 
-async def generate_audio_for_language(client, language_config, output_dir, play_audio=False):
-    """Generate audio for a single language configuration."""
+async def generate_audio_for_language(client, language_config, output_dir: Path, run_id: int,
+                                      counter: Iterator[int], player: Optional[AudioPlayer] = None,
+                                      playback_lock: Optional[asyncio.Lock] = None,
+                                      report: Optional[List[str]] = None):
+    """
+    Generate audio for a single language configuration, playing it if a player is given.
+    
+    Filenames combine the run id with the next value of ``counter`` so
+    languages processed concurrently never collide. Progress lines are
+    collected in ``report`` (which may already hold a header) and printed
+    as one block, and playback holds ``playback_lock`` so clips from
+    concurrent languages never play over each other.
+    """
     lang_code = language_config['code']
     lang_name = language_config['name']
     flag = language_config['flag']
@@ -42,9 +55,13 @@ async def generate_audio_for_language(client, language_config, output_dir, play_
     voice = language_config['voice']
     alt_voice = language_config.get('alt_voice')
     
-    print(f"\n{flag} {lang_name} ({lang_code.upper()})")
-    print(f"Text: {text}")
-    print(f"Voice: {voice}")
+    if report is None:
+        report = []
+    log = report.append
+    
+    log(f"\n{flag} {lang_name} ({lang_code.upper()})")
+    log(f"Text: {text}")
+    log(f"Voice: {voice}")
     
     try:
         # Try primary voice first
@@ -54,45 +71,48 @@ async def generate_audio_for_language(client, language_config, output_dir, play_
         try:
             audio_data = await client.synthesize_text(text, voice)
         except TTSError as e:
-            print(f"Primary voice failed: {e}")
+            log(f"Primary voice failed: {e}")
             if alt_voice:
-                print(f"Trying alternative voice: {alt_voice}")
+                log(f"Trying alternative voice: {alt_voice}")
                 try:
                     audio_data = await client.synthesize_text(text, alt_voice)
                     used_voice = alt_voice
                 except TTSError as e2:
-                    print(f"Alternative voice also failed: {e2}")
+                    log(f"Alternative voice also failed: {e2}")
                     raise e2
             else:
                 raise e
         
         # Generate filename
-        timestamp = int(time.time())
         lang_prefix = lang_code.split('-')[0]  # e.g., 'zh' from 'zh-cn'
-        filename = f"multilingual_{lang_prefix}_python_{timestamp}.mp3"
-        output_path = os.path.join(output_dir, filename)
+        filename = f"multilingual_{lang_prefix}_python_{run_id}_{next(counter):03d}.mp3"
+        output_path = output_dir / filename
         
         # Save audio
         await client.save_audio(audio_data, output_path)
         
-        print(f"✅ Generated: {filename}")
-        print(f"📁 Saved to: {output_path}")
-        print(f"🎤 Used voice: {used_voice}")
+        log(f"✅ Generated: {filename}")
+        log(f"📁 Saved to: {output_path}")
+        log(f"🎤 Used voice: {used_voice}")
+        print("\n".join(report))
         
         # Play audio if requested
-        if play_audio:
-            try:
-                print("🔊 Playing audio...")
-                player = AudioPlayer()
-                player.play_file(output_path)
-                print("✅ Playback completed")
-            except AudioError as e:
-                print(f"⚠️  Could not play audio: {e}")
+        if player is not None:
+            if playback_lock is None:
+                playback_lock = asyncio.Lock()
+            async with playback_lock:
+                try:
+                    print(f"🔊 Playing {filename}...")
+                    await player.play_file_async(output_path)
+                    print("✅ Playback completed")
+                except AudioError as e:
+                    print(f"⚠️  Could not play {filename}: {e}")
         
         return True
         
     except Exception as e:
-        print(f"❌ Failed to generate audio for {lang_name}: {e}")
+        log(f"❌ Failed to generate audio for {lang_name}: {e}")
+        print("\n".join(report))
         return False
 
 
@@ -128,30 +148,44 @@ async def main():
         print(f"❌ Failed to initialize TTS client: {e}")
         return 1
     
-    # Process each language
-    successful_count = 0
-    failed_count = 0
+    # One player shared by every language; set play_audio to True to hear each result.
+    # The lock makes concurrently generated clips play one at a time.
+    play_audio = False
+    player = None
+    playback_lock = asyncio.Lock()
+    if play_audio:
+        try:
+            player = AudioPlayer()
+        except AudioError as e:
+            print(f"⚠️  Audio playback disabled: {e}")
+    
+    # Process languages concurrently, bounded by the client's max_concurrent
     start_time = time.time()
+    base_dir = Path(output_dir)
+    run_id = int(start_time)
+    counter = itertools.count(1)
+    semaphore = asyncio.Semaphore(client.config.max_concurrent)
     
-    for i, language_config in enumerate(languages, 1):
-        print(f"\n📍 Processing language {i}/{len(languages)}")
-        
-        success = await generate_audio_for_language(
-            client, 
-            language_config, 
-            output_dir, 
-            play_audio=False  # Set to True if you want to play each audio
-        )
-        
-        if success:
-            successful_count += 1
-        else:
-            failed_count += 1
-        
-        # Small delay between languages to be polite to the service
-        if i < len(languages):
-            print("⏳ Waiting before next language...")
-            await asyncio.sleep(2)
+    async def process_language(i, language_config):
+        async with semaphore:
+            return await generate_audio_for_language(
+                client, 
+                language_config, 
+                base_dir, 
+                run_id, 
+                counter, 
+                player,
+                playback_lock,
+                [f"\n📍 Processing language {i}/{len(languages)}"]
+            )
+    
+    results = await asyncio.gather(
+        *(process_language(i, language_config) for i, language_config in enumerate(languages, 1)),
+        return_exceptions=True
+    )
+    
+    successful_count = sum(1 for result in results if result is True)
+    failed_count = len(results) - successful_count
     
     # Summary
     end_time = time.time()
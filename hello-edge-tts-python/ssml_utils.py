@@ -5,8 +5,57 @@ This module provides helper functions and classes for creating and validating
 SSML markup for use with Microsoft Edge TTS service.
 """
 
-from typing import List, Dict, Any
-import xml.etree.ElementTree as ET
+import io
+import re
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+
+try:
+    from lxml import etree as ET
+    # Never expand entities or touch the network while parsing user SSML
+    _PARSER = ET.XMLParser(resolve_entities=False, no_network=True)
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _PARSER = None
+
+
+# Fixed pieces of the <speak>/<voice> wrapper shared by every document
+_SPEAK_OPEN = '<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="'
+_VOICE_OPEN = '">\n    <voice name="'
+_VOICE_BODY = '">\n        '
+_SPEAK_CLOSE = '\n    </voice>\n</speak>'
+
+
+def wrap_speak(body: str, voice: str, lang: str) -> str:
+    """
+    Wrap SSML body content in the <speak> and <voice> elements.
+    
+    Args:
+        body: Inner SSML content
+        voice: Voice name to use
+        lang: Language code for the xml:lang attribute
+        
+    Returns:
+        Complete SSML markup string
+    """
+    return ''.join((_SPEAK_OPEN, lang, _VOICE_OPEN, voice, _VOICE_BODY, body, _SPEAK_CLOSE))
+
+
+@lru_cache(maxsize=256)
+def extract_language(voice: str) -> str:
+    """
+    Extract the language code from a voice name.
+    
+    Args:
+        voice: Voice name (e.g., 'en-US-AriaNeural')
+        
+    Returns:
+        Language code (e.g., 'en-US'), or 'en-US' if the name has none
+    """
+    parts = voice.split('-', 2)
+    if len(parts) >= 2:
+        return f"{parts[0]}-{parts[1]}"
+    return "en-US"
 
 
 class SSMLBuilder:
@@ -21,93 +70,92 @@ class SSMLBuilder:
             lang: Language code (auto-detected from voice if not provided)
         """
         self.voice = voice
-        self.lang = lang or self._extract_language(voice)
-        self.elements = []
-    
-    def _extract_language(self, voice: str) -> str:
-        """Extract language code from voice name."""
-        parts = voice.split('-')
-        if len(parts) >= 2:
-            return f"{parts[0]}-{parts[1]}"
-        return "en-US"
+        self.lang = lang or extract_language(voice)
+        self._buf = io.StringIO()
     
     def add_text(self, text: str) -> 'SSMLBuilder':
         """Add plain text."""
-        self.elements.append(text)
+        self._buf.write(text)
         return self
     
     def add_prosody(self, text: str, rate: str = None, pitch: str = None, volume: str = None) -> 'SSMLBuilder':
         """Add text with prosody controls."""
-        attrs = []
+        write = self._buf.write
+        write('<prosody')
         if rate:
-            attrs.append(f'rate="{rate}"')
+            write(f' rate="{rate}"')
         if pitch:
-            attrs.append(f'pitch="{pitch}"')
+            write(f' pitch="{pitch}"')
         if volume:
-            attrs.append(f'volume="{volume}"')
-        
-        attr_str = ' ' + ' '.join(attrs) if attrs else ''
-        self.elements.append(f'<prosody{attr_str}>{text}</prosody>')
+            write(f' volume="{volume}"')
+        write('>')
+        write(text)
+        write('</prosody>')
         return self
     
     def add_emphasis(self, text: str, level: str = "moderate") -> 'SSMLBuilder':
         """Add emphasized text."""
-        self.elements.append(f'<emphasis level="{level}">{text}</emphasis>')
+        self._buf.write(f'<emphasis level="{level}">{text}</emphasis>')
         return self
     
     def add_break(self, time: str = "1s") -> 'SSMLBuilder':
         """Add a break/pause."""
-        self.elements.append(f'<break time="{time}"/>')
+        self._buf.write(f'<break time="{time}"/>')
         return self
     
     def add_say_as(self, text: str, interpret_as: str, format: str = None) -> 'SSMLBuilder':
         """Add say-as element for special text interpretation."""
-        format_attr = f' format="{format}"' if format else ''
-        self.elements.append(f'<say-as interpret-as="{interpret_as}"{format_attr}>{text}</say-as>')
+        write = self._buf.write
+        write(f'<say-as interpret-as="{interpret_as}"')
+        if format:
+            write(f' format="{format}"')
+        write(f'>{text}</say-as>')
         return self
     
     def add_phoneme(self, text: str, alphabet: str, ph: str) -> 'SSMLBuilder':
         """Add phoneme pronunciation."""
-        self.elements.append(f'<phoneme alphabet="{alphabet}" ph="{ph}">{text}</phoneme>')
+        self._buf.write(f'<phoneme alphabet="{alphabet}" ph="{ph}">{text}</phoneme>')
         return self
     
     def add_sub(self, text: str, alias: str) -> 'SSMLBuilder':
         """Add substitution."""
-        self.elements.append(f'<sub alias="{alias}">{text}</sub>')
+        self._buf.write(f'<sub alias="{alias}">{text}</sub>')
         return self
     
     def build(self) -> str:
         """Build the complete SSML markup."""
-        content = ''.join(self.elements)
-        return f'''<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="{self.lang}">
-    <voice name="{self.voice}">
-        {content}
-    </voice>
-</speak>'''
+        return wrap_speak(self._buf.getvalue(), self.voice, self.lang)
+
+
+def _localname(tag) -> Optional[str]:
+    """Strip the '{namespace}' prefix from an element tag."""
+    if not isinstance(tag, str):
+        return None  # lxml comments and processing instructions
+    return tag.rpartition('}')[2]
 
 
 class SSMLValidator:
     """Validator for SSML markup."""
     
-    VALID_PROSODY_RATES = {
+    VALID_PROSODY_RATES = frozenset({
         'x-slow', 'slow', 'medium', 'fast', 'x-fast'
-    }
+    })
     
-    VALID_PROSODY_PITCHES = {
+    VALID_PROSODY_PITCHES = frozenset({
         'x-low', 'low', 'medium', 'high', 'x-high'
-    }
+    })
     
-    VALID_PROSODY_VOLUMES = {
+    VALID_PROSODY_VOLUMES = frozenset({
         'silent', 'x-soft', 'soft', 'medium', 'loud', 'x-loud'
-    }
+    })
     
-    VALID_EMPHASIS_LEVELS = {
+    VALID_EMPHASIS_LEVELS = frozenset({
         'strong', 'moderate', 'reduced'
-    }
+    })
     
-    VALID_BREAK_STRENGTHS = {
+    VALID_BREAK_STRENGTHS = frozenset({
         'none', 'x-weak', 'weak', 'medium', 'strong', 'x-strong'
-    }
+    })
     
     @staticmethod
     def validate(ssml: str) -> List[str]:
@@ -124,64 +172,49 @@ class SSMLValidator:
         
         try:
             # Parse XML
-            root = ET.fromstring(ssml)
+            root = ET.fromstring(ssml.encode('utf-8'), _PARSER)
             
             # Check root element
-            if root.tag != 'speak':
+            if _localname(root.tag) != 'speak':
                 errors.append("Root element must be <speak>")
             
             # Check required attributes
             if 'version' not in root.attrib:
                 errors.append("Missing version attribute in <speak> element")
             
-            if 'xmlns' not in root.attrib:
+            # Parsers fold xmlns into the "{namespace}tag" name, not attrib
+            if not root.tag.startswith('{'):
                 errors.append("Missing xmlns attribute in <speak> element")
             
-            # Validate child elements
-            SSMLValidator._validate_element(root, errors)
+            # Validate every element in document order; iter() walks the
+            # tree inside the parser's C code rather than recursing in Python
+            get_validator = _VALIDATORS.get
+            for element in root.iter():
+                validator = get_validator(_localname(element.tag))
+                if validator is not None:
+                    validator(element, errors)
             
         except ET.ParseError as e:
             errors.append(f"XML parsing error: {str(e)}")
         
         return errors
     
-    @staticmethod
-    def _validate_element(element: ET.Element, errors: List[str]) -> None:
-        """Recursively validate SSML elements."""
-        tag = element.tag
-        
-        if tag == 'prosody':
-            SSMLValidator._validate_prosody(element, errors)
-        elif tag == 'emphasis':
-            SSMLValidator._validate_emphasis(element, errors)
-        elif tag == 'break':
-            SSMLValidator._validate_break(element, errors)
-        elif tag == 'say-as':
-            SSMLValidator._validate_say_as(element, errors)
-        
-        # Recursively validate children
-        for child in element:
-            SSMLValidator._validate_element(child, errors)
-    
     @staticmethod
     def _validate_prosody(element: ET.Element, errors: List[str]) -> None:
         """Validate prosody element."""
         if 'rate' in element.attrib:
             rate = element.attrib['rate']
-            if not (rate in SSMLValidator.VALID_PROSODY_RATES or 
-                   rate.endswith('%') or rate.endswith('Hz')):
+            if not _RATE_PATTERN.fullmatch(rate):
                 errors.append(f"Invalid prosody rate: {rate}")
         
         if 'pitch' in element.attrib:
             pitch = element.attrib['pitch']
-            if not (pitch in SSMLValidator.VALID_PROSODY_PITCHES or 
-                   pitch.endswith('Hz') or pitch.endswith('st')):
+            if not _PITCH_PATTERN.fullmatch(pitch):
                 errors.append(f"Invalid prosody pitch: {pitch}")
         
         if 'volume' in element.attrib:
             volume = element.attrib['volume']
-            if not (volume in SSMLValidator.VALID_PROSODY_VOLUMES or 
-                   volume.endswith('dB')):
+            if not _VOLUME_PATTERN.fullmatch(volume):
                 errors.append(f"Invalid prosody volume: {volume}")
     
     @staticmethod
@@ -197,7 +230,7 @@ class SSMLValidator:
         """Validate break element."""
         if 'time' in element.attrib:
             time = element.attrib['time']
-            if not (time.endswith('s') or time.endswith('ms')):
+            if not _BREAK_TIME_PATTERN.fullmatch(time):
                 errors.append(f"Invalid break time format: {time}")
         
         if 'strength' in element.attrib:
@@ -212,15 +245,42 @@ class SSMLValidator:
             errors.append("say-as element missing interpret-as attribute")
 
 
-# Predefined SSML templates
+def _keyword_or(keywords: frozenset, numeric: str) -> 're.Pattern':
+    """Compile a pattern matching one of the keywords or the numeric form."""
+    return re.compile('|'.join([*(re.escape(k) for k in sorted(keywords)), numeric]))
+
+
+# Attribute value formats, matched against the whole value
+_NUMBER = r'[+-]?\d+(?:\.\d+)?'
+_RATE_PATTERN = _keyword_or(SSMLValidator.VALID_PROSODY_RATES, _NUMBER + '%?')
+_PITCH_PATTERN = _keyword_or(SSMLValidator.VALID_PROSODY_PITCHES, _NUMBER + '(?:Hz|st|%)')
+_VOLUME_PATTERN = _keyword_or(SSMLValidator.VALID_PROSODY_VOLUMES, _NUMBER + '(?:dB|%)?')
+_BREAK_TIME_PATTERN = re.compile(r'\d+(?:\.\d+)?m?s')
+
+
+# Per-tag validators used by SSMLValidator.validate
+_VALIDATORS = {
+    'prosody': SSMLValidator._validate_prosody,
+    'emphasis': SSMLValidator._validate_emphasis,
+    'break': SSMLValidator._validate_break,
+    'say-as': SSMLValidator._validate_say_as,
+}
+
+
+# Predefined SSML templates: str.format patterns with {lang}, {voice} and {text} holes
+def _speak_template(body: str) -> str:
+    """Build a complete SSML format template around a fixed body pattern."""
+    return wrap_speak(body, '{voice}', '{lang}')
+
+
 SSML_TEMPLATES = {
-    'slow_speech': lambda text, voice: SSMLBuilder(voice).add_prosody(text, rate="slow").build(),
-    'fast_speech': lambda text, voice: SSMLBuilder(voice).add_prosody(text, rate="fast").build(),
-    'whisper': lambda text, voice: SSMLBuilder(voice).add_prosody(text, volume="x-soft", rate="slow").build(),
-    'excited': lambda text, voice: SSMLBuilder(voice).add_prosody(text, rate="fast", pitch="high", volume="loud").build(),
-    'calm': lambda text, voice: SSMLBuilder(voice).add_prosody(text, rate="slow", pitch="low", volume="soft").build(),
-    'emphasis_strong': lambda text, voice: SSMLBuilder(voice).add_emphasis(text, "strong").build(),
-    'with_pauses': lambda text, voice: SSMLBuilder(voice).add_text(text.split('.')[0]).add_break("1s").add_text('.'.join(text.split('.')[1:])).build() if '.' in text else SSMLBuilder(voice).add_text(text).build(),
+    'slow_speech': _speak_template('<prosody rate="slow">{text}</prosody>'),
+    'fast_speech': _speak_template('<prosody rate="fast">{text}</prosody>'),
+    'whisper': _speak_template('<prosody rate="slow" volume="x-soft">{text}</prosody>'),
+    'excited': _speak_template('<prosody rate="fast" pitch="high" volume="loud">{text}</prosody>'),
+    'calm': _speak_template('<prosody rate="slow" pitch="low" volume="soft">{text}</prosody>'),
+    'emphasis_strong': _speak_template('<emphasis level="strong">{text}</emphasis>'),
+    'with_pauses': _speak_template('{text}'),
 }
 
 
@@ -243,7 +303,15 @@ def create_ssml_from_template(template_name: str, text: str, voice: str) -> str:
         available = ', '.join(SSML_TEMPLATES.keys())
         raise ValueError(f"Unknown template '{template_name}'. Available: {available}")
     
-    return SSML_TEMPLATES[template_name](text, voice)
+    if template_name == 'with_pauses':
+        # Pause after the first sentence
+        head, sep, tail = text.partition('.')
+        if sep:
+            text = f'{head}<break time="1s"/>{tail}'
+    
+    return SSML_TEMPLATES[template_name].format(
+        lang=extract_language(voice), voice=voice, text=text
+    )
 
 
 def validate_ssml(ssml: str, raise_on_error: bool = True) -> List[str]:
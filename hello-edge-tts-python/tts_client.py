@@ -3,12 +3,38 @@ TTSClient implementation for Microsoft Edge TTS service.
 """
 
 import asyncio
+import logging
+import os
+import time
+import weakref
+from operator import itemgetter
 import edge_tts
 import aiofiles
-from typing import List, Optional
-from voice import Voice
+from typing import Dict, List, Optional
+from voice import Voice, locale_prefixes
 from config_manager import TTSConfig
-from ssml_utils import SSMLBuilder, validate_ssml
+from ssml_utils import SSMLBuilder, extract_language, validate_ssml, wrap_speak
+
+logger = logging.getLogger(__name__)
+
+
+# Edge TTS voice entry keys, in Voice(name, display_name, locale, gender) order.
+# ShortName is the main identifier and FriendlyName the display name.
+_voice_fields = itemgetter("ShortName", "FriendlyName", "Locale", "Gender")
+
+
+# Largest slice handed to a single write() when saving audio
+_WRITE_CHUNK_SIZE = 1 << 20
+
+
+def _write_file(filename: str, data: bytes) -> None:
+    """Write bytes to a file without Python-level buffering."""
+    view = memoryview(data)
+    with open(filename, 'wb', buffering=0) as f:
+        while view:
+            # Raw writes may be partial, so advance by what was written
+            written = f.write(view[:_WRITE_CHUNK_SIZE])
+            view = view[written:]
 
 
 class TTSError(Exception):
@@ -23,6 +49,15 @@ class TTSClient:
     Provides methods for text synthesis, voice management, and audio file operations.
     """
     
+    # Seconds before the shared voice list is refetched; None keeps it for the process lifetime
+    VOICES_CACHE_TTL: Optional[float] = None
+    
+    # Voice list and language index shared by all clients in the process
+    _voices_cache: Optional[List[Voice]] = None
+    _voices_by_language: Dict[str, List[Voice]] = {}
+    _voices_fetched_at: float = 0.0
+    _voices_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+    
     def __init__(self, config: Optional[TTSConfig] = None):
         """
         Initialize TTSClient with optional configuration.
@@ -31,9 +66,9 @@ class TTSClient:
             config: Optional TTSConfig instance for client configuration
         """
         self.config = config or TTSConfig()
-        self._voices_cache: Optional[List[Voice]] = None
     
-    async def synthesize_text(self, text: str, voice: str, use_ssml: bool = False) -> bytes:
+    async def synthesize_text(self, text: str, voice: str, use_ssml: bool = False,
+                              validate: bool = True) -> bytes:
         """
         Convert text to audio data using specified voice.
         
@@ -41,6 +76,8 @@ class TTSClient:
             text: Text to convert to speech (plain text or SSML)
             voice: Voice name to use for synthesis
             use_ssml: Whether the text contains SSML markup
+            validate: Whether to validate SSML first; pass False to skip
+                validation for markup already checked by the caller
             
         Returns:
             Audio data as bytes
@@ -50,26 +87,81 @@ class TTSClient:
         """
         try:
             # Validate SSML if specified
-            if use_ssml:
+            if use_ssml and validate:
                 self._validate_ssml(text)
             
             # Create TTS communicate object with WAV format
             communicate = edge_tts.Communicate(text, voice)
             
-            # Collect audio data
-            audio_data = b""
+            # Collect audio data; extending a bytearray avoids re-copying
+            # everything received so far on each chunk
+            audio_data = bytearray()
             async for chunk in communicate.stream():
                 if chunk["type"] == "audio":
-                    audio_data += chunk["data"]
+                    audio_data.extend(chunk["data"])
             
             if not audio_data:
                 raise TTSError(f"No audio data generated for text: {text[:50]}...")
                 
-            return audio_data
+            return bytes(audio_data)
             
         except Exception as e:
             raise TTSError(f"Failed to synthesize text: {str(e)}")
     
+    async def synthesize_to_file(self, text: str, voice: str, filename: str, use_ssml: bool = False,
+                                 validate: bool = True) -> None:
+        """
+        Convert text to speech and stream the audio straight to a file.
+        
+        Unlike synthesize_text followed by save_audio, chunks are written as
+        they arrive, so the whole utterance is never held in memory.
+        
+        Args:
+            text: Text to convert to speech (plain text or SSML)
+            voice: Voice name to use for synthesis
+            filename: Output filename
+            use_ssml: Whether the text contains SSML markup
+            validate: Whether to validate SSML first; pass False to skip
+                validation for markup already checked by the caller
+            
+        Raises:
+            TTSError: If synthesis or writing the file fails
+        """
+        partial_filename = f"{filename}.part"
+        completed = False
+        try:
+            # Validate SSML if specified
+            if use_ssml and validate:
+                self._validate_ssml(text)
+            
+            communicate = edge_tts.Communicate(text, voice)
+            
+            # Stream into a sibling .part file and move it into place only
+            # once complete, so a failure never leaves a truncated file behind
+            received_audio = False
+            async with aiofiles.open(partial_filename, 'wb') as f:
+                async for chunk in communicate.stream():
+                    if chunk["type"] == "audio":
+                        await f.write(chunk["data"])
+                        received_audio = True
+            
+            if not received_audio:
+                raise TTSError(f"No audio data generated for text: {text[:50]}...")
+            
+            os.replace(partial_filename, filename)
+            completed = True
+                
+        except Exception as e:
+            raise TTSError(f"Failed to synthesize text to {filename}: {str(e)}")
+        finally:
+            # Clean up the partial file, also on cancellation and Ctrl-C
+            if not completed:
+                try:
+                    if os.path.exists(partial_filename):
+                        os.unlink(partial_filename)
+                except Exception:
+                    pass  # Ignore cleanup errors
+    
     async def synthesize_ssml(self, ssml: str, voice: str) -> bytes:
         """
         Convert SSML to audio data using specified voice.
@@ -98,37 +190,73 @@ class TTSClient:
             TTSError: If file save fails
         """
         try:
-            async with aiofiles.open(filename, 'wb') as f:
-                await f.write(audio_data)
+            # One executor hop for the whole write instead of one per aiofiles call
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _write_file, filename, audio_data)
         except Exception as e:
             raise TTSError(f"Failed to save audio to {filename}: {str(e)}")
     
+    @classmethod
+    def _voices_cache_valid(cls) -> bool:
+        """Check whether the shared voice list is present and not expired."""
+        if cls._voices_cache is None:
+            return False
+        ttl = cls.VOICES_CACHE_TTL
+        return ttl is None or time.monotonic() - cls._voices_fetched_at < ttl
+    
+    @classmethod
+    def _get_voices_lock(cls) -> asyncio.Lock:
+        """Get the lock guarding the voice fetch for the running event loop."""
+        loop = asyncio.get_running_loop()
+        lock = cls._voices_locks.get(loop)
+        if lock is None:
+            lock = cls._voices_locks[loop] = asyncio.Lock()
+        return lock
+    
+    @staticmethod
+    def _index_voices_by_language(voices: List[Voice]) -> Dict[str, List[Voice]]:
+        """
+        Index voices under every hyphen-delimited prefix of their locale.
+        
+        'zh-CN-liaoning' is listed under 'zh', 'zh-CN' and 'zh-CN-liaoning',
+        so script and regional locales ('sr-Latn', 'iu-Cans') resolve too.
+        """
+        index: Dict[str, List[Voice]] = {}
+        for voice in voices:
+            for prefix in locale_prefixes(voice.locale):
+                index.setdefault(prefix, []).append(voice)
+        return index
+    
     async def list_voices(self) -> List[Voice]:
         """
         Get all available voices from Edge TTS service.
         
+        The list is fetched once and shared by every TTSClient in the
+        process (see VOICES_CACHE_TTL).
+        
         Returns:
             List of Voice objects
             
         Raises:
             TTSError: If voice listing fails
         """
-        if self._voices_cache is None:
-            try:
-                voices_data = await edge_tts.list_voices()
-                self._voices_cache = [
-                    Voice(
-                        name=voice["ShortName"],  # Use ShortName as the main identifier
-                        display_name=voice["FriendlyName"],  # Use FriendlyName as display name
-                        locale=voice["Locale"],
-                        gender=voice["Gender"]
-                    )
-                    for voice in voices_data
-                ]
-            except Exception as e:
-                raise TTSError(f"Failed to list voices: {str(e)}")
+        cls = type(self)
+        if not cls._voices_cache_valid():
+            async with cls._get_voices_lock():
+                # Another coroutine may have filled the cache while we waited
+                if not cls._voices_cache_valid():
+                    try:
+                        voices_data = await edge_tts.list_voices()
+                        # Service data is trusted, so skip per-voice field validation
+                        voices = [Voice.from_trusted(*_voice_fields(voice)) for voice in voices_data]
+                    except Exception as e:
+                        raise TTSError(f"Failed to list voices: {str(e)}")
+                    
+                    cls._voices_by_language = cls._index_voices_by_language(voices)
+                    cls._voices_cache = voices
+                    cls._voices_fetched_at = time.monotonic()
         
-        return self._voices_cache
+        return cls._voices_cache
     
     async def get_voices_by_language(self, language: str) -> List[Voice]:
         """
@@ -144,22 +272,19 @@ class TTSClient:
             TTSError: If voice filtering fails
         """
         try:
-            all_voices = await self.list_voices()
-            
-            # Filter by language - support both 'en' and 'en-US' formats
-            filtered_voices = []
-            for voice in all_voices:
-                if voice.locale.startswith(language) or voice.locale.split('-')[0] == language:
-                    filtered_voices.append(voice)
+            await self.list_voices()
             
-            return filtered_voices
+            # Any locale prefix ('en', 'en-US', 'zh-CN') via the prebuilt index
+            return list(type(self)._voices_by_language.get(language, ()))
             
         except Exception as e:
             raise TTSError(f"Failed to filter voices by language {language}: {str(e)}")
     
     def clear_voice_cache(self) -> None:
-        """Clear the cached voice list to force refresh on next request."""
-        self._voices_cache = None
+        """Clear the shared voice list to force refresh on next request."""
+        cls = type(self)
+        cls._voices_cache = None
+        cls._voices_by_language = {}
     
     def create_ssml(self, text: str, voice: str, rate: str = "0%", pitch: str = "0%", volume: str = "100%") -> str:
         """
@@ -176,16 +301,10 @@ class TTSClient:
             SSML markup string
         """
         # Extract language from voice name for xml:lang attribute
-        lang = voice.split('-')[0] + '-' + voice.split('-')[1] if '-' in voice else 'en-US'
+        lang = extract_language(voice)
         
-        ssml = f'''<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="{lang}">
-    <voice name="{voice}">
-        <prosody rate="{rate}" pitch="{pitch}" volume="{volume}">
-            {text}
-        </prosody>
-    </voice>
-</speak>'''
-        return ssml
+        body = f'<prosody rate="{rate}" pitch="{pitch}" volume="{volume}">\n            {text}\n        </prosody>'
+        return wrap_speak(body, voice, lang)
     
     def create_emphasis_ssml(self, text: str, voice: str, emphasis_level: str = "moderate") -> str:
         """
@@ -199,14 +318,9 @@ class TTSClient:
         Returns:
             SSML markup string
         """
-        lang = voice.split('-')[0] + '-' + voice.split('-')[1] if '-' in voice else 'en-US'
+        lang = extract_language(voice)
         
-        ssml = f'''<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="{lang}">
-    <voice name="{voice}">
-        <emphasis level="{emphasis_level}">{text}</emphasis>
-    </voice>
-</speak>'''
-        return ssml
+        return wrap_speak(f'<emphasis level="{emphasis_level}">{text}</emphasis>', voice, lang)
     
     def create_break_ssml(self, text_parts: List[str], voice: str, break_time: str = "1s") -> str:
         """
@@ -220,16 +334,11 @@ class TTSClient:
         Returns:
             SSML markup string
         """
-        lang = voice.split('-')[0] + '-' + voice.split('-')[1] if '-' in voice else 'en-US'
+        lang = extract_language(voice)
         
         content = f'<break time="{break_time}"/>'.join(text_parts)
         
-        ssml = f'''<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="{lang}">
-    <voice name="{voice}">
-        {content}
-    </voice>
-</speak>'''
-        return ssml
+        return wrap_speak(content, voice, lang)
     
     def _validate_ssml(self, ssml: str) -> None:
         """
@@ -264,28 +373,20 @@ class TTSClient:
         """
         Convert multiple texts to audio data using specified voice.
         
+        Texts are synthesized concurrently, up to config.max_concurrent at a time.
+        
         Args:
             texts: List of texts to convert to speech
             voice: Voice name to use for synthesis
             use_ssml: Whether the texts contain SSML markup
             
         Returns:
-            List of audio data as bytes
+            List of audio data as bytes, in the same order as texts
             
         Raises:
             TTSError: If synthesis fails
         """
-        results = []
-        
-        for i, text in enumerate(texts):
-            try:
-                print(f"Processing batch item {i+1}/{len(texts)}: {text[:50]}...")
-                audio_data = await self.synthesize_text(text, voice, use_ssml)
-                results.append(audio_data)
-            except Exception as e:
-                raise TTSError(f"Failed to synthesize batch item {i+1}: {str(e)}")
-        
-        return results
+        return await self._synthesize_many(texts, voice, use_ssml, self.config.max_concurrent, "batch")
     
     async def batch_synthesize_concurrent(self, texts: List[str], voice: str, use_ssml: bool = False, max_concurrent: int = 3) -> List[bytes]:
         """
@@ -303,33 +404,52 @@ class TTSClient:
         Raises:
             TTSError: If synthesis fails
         """
-        import asyncio
+        return await self._synthesize_many(texts, voice, use_ssml, max_concurrent, "concurrent")
+    
+    async def _synthesize_many(self, texts: List[str], voice: str, use_ssml: bool,
+                               max_concurrent: int, kind: str) -> List[bytes]:
+        """
+        Synthesize texts concurrently, failing fast on the first error.
         
+        Args:
+            texts: List of texts to convert to speech
+            voice: Voice name to use for synthesis
+            use_ssml: Whether the texts contain SSML markup
+            max_concurrent: Maximum number of concurrent requests
+            kind: Item label for log and error messages ('batch' or 'concurrent')
+            
+        Returns:
+            List of audio data as bytes, in the same order as texts
+            
+        Raises:
+            TTSError: If synthesis fails
+        """
         semaphore = asyncio.Semaphore(max_concurrent)
+        total = len(texts)
         
-        async def synthesize_with_semaphore(text: str, index: int) -> tuple[int, bytes]:
+        async def synthesize_with_semaphore(text: str, index: int) -> bytes:
             async with semaphore:
                 try:
-                    print(f"Processing concurrent item {index+1}/{len(texts)}: {text[:50]}...")
-                    audio_data = await self.synthesize_text(text, voice, use_ssml)
-                    return (index, audio_data)
+                    logger.debug("Processing %s item %d/%d: %.50s...", kind, index + 1, total, text)
+                    return await self.synthesize_text(text, voice, use_ssml)
                 except Exception as e:
-                    raise TTSError(f"Failed to synthesize concurrent item {index+1}: {str(e)}")
-        
-        # Create tasks for all texts
-        tasks = [synthesize_with_semaphore(text, i) for i, text in enumerate(texts)]
+                    raise TTSError(f"Failed to synthesize {kind} item {index+1}: {str(e)}")
         
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks)
-        
-        # Sort results by original index to maintain order
-        results.sort(key=lambda x: x[0])
-        
-        return [audio_data for _, audio_data in results]
+        tasks = [asyncio.create_task(synthesize_with_semaphore(text, i)) for i, text in enumerate(texts)]
+        try:
+            # gather returns results in task order, so no re-sorting is needed
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop the remaining syntheses instead of leaving them running
+            # after the caller already has the error
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
     
     async def batch_save_audio(self, audio_data_list: List[bytes], filename_template: str) -> List[str]:
         """
-        Save multiple audio data to files.
+        Save multiple audio data to files concurrently.
         
         Args:
             audio_data_list: List of audio data as bytes
@@ -341,15 +461,19 @@ class TTSClient:
         Raises:
             TTSError: If file save fails
         """
-        saved_files = []
+        filenames = [filename_template.format(i+1) for i in range(len(audio_data_list))]
         
-        for i, audio_data in enumerate(audio_data_list):
+        async def save_item(index: int, audio_data: bytes, filename: str) -> None:
             try:
-                filename = filename_template.format(i+1)
                 await self.save_audio(audio_data, filename)
-                saved_files.append(filename)
-                print(f"Saved batch item {i+1}: {filename}")
+                logger.debug("Saved batch item %d: %s", index + 1, filename)
             except Exception as e:
-                raise TTSError(f"Failed to save batch item {i+1}: {str(e)}")
+                raise TTSError(f"Failed to save batch item {index+1}: {str(e)}")
+        
+        # Files are independent, so write them concurrently
+        await asyncio.gather(*(
+            save_item(i, audio_data, filename)
+            for i, (audio_data, filename) in enumerate(zip(audio_data_list, filenames))
+        ))
         
-        return saved_files
\ No newline at end of file
+        return filenames
\ No newline at end of file
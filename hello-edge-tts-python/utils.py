@@ -3,8 +3,9 @@ Utility functions for the hello-edge-tts Python implementation.
 """
 
 import asyncio
+import functools
 import os
-from pathlib import Path
+import re
 from typing import List, Optional
 try:
     from .tts_client import TTSClient, TTSError
@@ -16,14 +17,22 @@ except ImportError:
     from audio_player import AudioPlayer, AudioError
 
 
+# Any character outside ASCII letters, digits, '-', '_', '.' and space
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9\-_. ]")
+
+
+@functools.lru_cache(maxsize=128)
 def create_output_directory(directory: str) -> None:
     """
     Create output directory if it doesn't exist.
     
+    Results are memoized per path, so repeated calls skip the filesystem;
+    a directory removed after the first call is not recreated.
+    
     Args:
         directory: Directory path to create
     """
-    Path(directory).mkdir(parents=True, exist_ok=True)
+    os.makedirs(directory, exist_ok=True)
 
 
 def get_safe_filename(text: str, max_length: int = 50) -> str:
@@ -38,8 +47,7 @@ def get_safe_filename(text: str, max_length: int = 50) -> str:
         Safe filename string
     """
     # Remove or replace unsafe characters
-    safe_chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_. "
-    filename = "".join(c if c in safe_chars else "_" for c in text)
+    filename = _UNSAFE_FILENAME_CHARS.sub("_", text)
     
     # Truncate if too long
     if len(filename) > max_length:
@@ -77,13 +85,9 @@ async def synthesize_and_save(
         AudioError: If audio playback fails
     """
     try:
-        # Synthesize text
-        print(f"Synthesizing text with voice '{voice}'...")
-        audio_data = await client.synthesize_text(text, voice)
-        
-        # Save to file
-        print(f"Saving audio to '{output_file}'...")
-        await client.save_audio(audio_data, output_file)
+        # Synthesize straight to disk; playback below reads the saved file
+        print(f"Synthesizing text with voice '{voice}' to '{output_file}'...")
+        await client.synthesize_to_file(text, voice, output_file)
         
         print(f"Audio saved successfully to '{output_file}'")
         
@@ -91,7 +95,7 @@ async def synthesize_and_save(
         if play_audio:
             print("Playing audio...")
             player = AudioPlayer()
-            player.play_file(output_file)
+            await player.play_file_async(output_file)
             print("Playback completed")
             
     except TTSError as e:
@@ -2,16 +2,45 @@
 Voice model and voice management functionality.
 """
 
+import sys
+from bisect import bisect_left, insort
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 
-@dataclass
+def _intern(value):
+    """Intern exact str values; sys.intern rejects subclasses and other types."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def locale_prefixes(locale: str) -> Iterator[str]:
+    """
+    Yield every hyphen-delimited prefix of a locale, ending with the locale itself.
+    
+    'zh-CN-liaoning' yields 'zh', 'zh-CN' and 'zh-CN-liaoning'. These are
+    the keys a voice is indexed under for language lookups.
+    
+    Args:
+        locale: Locale code (e.g., 'en-US')
+    """
+    end = locale.find('-')
+    while end != -1:
+        yield locale[:end]
+        end = locale.find('-', end + 1)
+    yield locale
+
+
+@dataclass(frozen=True)
 class Voice:
     """
     Represents a TTS voice with its properties.
     """
     
+    # No per-instance __dict__: the full Edge TTS catalog holds hundreds of voices.
+    # _lang/_country hold the locale parts and _gender_lc the lowercased gender,
+    # all computed once in __post_init__; _repr is filled on first repr().
+    __slots__ = ('name', 'display_name', 'locale', 'gender', '_lang', '_country', '_gender_lc', '_repr')
+    
     name: str
     display_name: str
     locale: str
@@ -27,6 +56,50 @@ class Voice:
             raise ValueError("Voice locale cannot be empty")
         if not self.gender:
             raise ValueError("Voice gender cannot be empty")
+        
+        self._set_derived()
+    
+    def _set_derived(self) -> None:
+        """Compute the cached attributes derived from locale and gender."""
+        # Frozen dataclass: derived attributes are set through the slot setters
+        # Locales and genders repeat across the whole catalog, so interning
+        # shares one string per value and lets filter comparisons hit the
+        # identity fast path; partition stops at the first '-'
+        locale = _intern(self.locale)
+        _set_locale(self, locale)
+        lang, sep, rest = locale.partition('-')
+        _set_lang(self, _intern(lang))
+        _set_country(self, rest.partition('-')[0] if sep else None)
+        _set_gender_lc(self, _intern(self.gender.lower()))
+    
+    @classmethod
+    def from_trusted(cls, name: str, display_name: str, locale: str, gender: str) -> 'Voice':
+        """
+        Create a Voice from trusted data, skipping field validation.
+        
+        Intended for bulk loads from a known-good source such as the Edge
+        TTS voice list; other callers should use the normal constructor.
+        
+        Args:
+            name: Voice name
+            display_name: Human-readable voice name
+            locale: Locale code (e.g., 'en-US')
+            gender: Voice gender
+            
+        Returns:
+            Voice instance
+        """
+        self = object.__new__(cls)
+        _set_name(self, name)
+        _set_display_name(self, display_name)
+        _set_locale(self, locale)
+        _set_gender(self, gender)
+        self._set_derived()
+        return self
+    
+    def __reduce__(self):
+        """Rebuild through __init__ so copy/pickle work with frozen slots."""
+        return (self.__class__, (self.name, self.display_name, self.locale, self.gender))
     
     @property
     def language_code(self) -> str:
@@ -36,7 +109,7 @@ class Voice:
         Returns:
             Language code string
         """
-        return self.locale.split('-')[0]
+        return self._lang
     
     @property
     def country_code(self) -> Optional[str]:
@@ -46,8 +119,7 @@ class Voice:
         Returns:
             Country code string or None if not available
         """
-        parts = self.locale.split('-')
-        return parts[1] if len(parts) > 1 else None
+        return self._country
     
     def matches_language(self, language: str) -> bool:
         """
@@ -59,11 +131,7 @@ class Voice:
         Returns:
             True if voice matches the language
         """
-        if language == self.locale:
-            return True
-        if language == self.language_code:
-            return True
-        return False
+        return language == self.locale or language == self._lang
     
     def __str__(self) -> str:
         """String representation of the voice."""
@@ -71,8 +139,23 @@ class Voice:
     
     def __repr__(self) -> str:
         """Detailed string representation for debugging."""
-        return (f"Voice(name='{self.name}', display_name='{self.display_name}', "
+        try:
+            return self._repr
+        except AttributeError:
+            pass
+        # Immutable, so the string can be built once and kept
+        text = (f"Voice(name='{self.name}', display_name='{self.display_name}', "
                 f"locale='{self.locale}', gender='{self.gender}')")
+        _set_repr(self, text)
+        return text
+
+
+# Slot descriptor setters: assigning through them bypasses the frozen
+# dataclass __setattr__ and is cheaper than object.__setattr__
+(_set_name, _set_display_name, _set_locale, _set_gender,
+ _set_lang, _set_country, _set_gender_lc, _set_repr) = (
+    Voice.__dict__[slot].__set__ for slot in Voice.__slots__
+)
 
 
 class VoiceManager:
@@ -92,6 +175,7 @@ class VoiceManager:
         Returns:
             Filtered list of Voice objects
         """
+        language = _intern(language)
         return [voice for voice in voices if voice.matches_language(language)]
     
     @staticmethod
@@ -106,20 +190,42 @@ class VoiceManager:
         Returns:
             Filtered list of Voice objects
         """
-        return [voice for voice in voices if voice.gender.lower() == gender.lower()]
+        gender = _intern(gender.lower())
+        return [voice for voice in voices if voice._gender_lc == gender]
     
     @staticmethod
-    def find_voice_by_name(voices: List[Voice], name: str) -> Optional[Voice]:
+    def build_name_index(voices: List[Voice]) -> Dict[str, Voice]:
+        """
+        Build a name -> Voice index for repeated find_voice_by_name calls.
+        
+        Args:
+            voices: List of Voice objects to index
+            
+        Returns:
+            Dictionary mapping voice names to Voice objects (first match wins)
+        """
+        index: Dict[str, Voice] = {}
+        for voice in voices:
+            index.setdefault(voice.name, voice)
+        return index
+    
+    @staticmethod
+    def find_voice_by_name(voices: List[Voice], name: str,
+                           index: Optional[Dict[str, Voice]] = None) -> Optional[Voice]:
         """
         Find a voice by its name.
         
         Args:
             voices: List of Voice objects to search
             name: Voice name to find
+            index: Optional index from build_name_index(voices) for O(1) lookup
             
         Returns:
             Voice object if found, None otherwise
         """
+        if index is not None:
+            return index.get(name)
+        
         for voice in voices:
             if voice.name == name:
                 return voice
@@ -139,7 +245,7 @@ class VoiceManager:
         languages = set()
         for voice in voices:
             languages.add(voice.language_code)
-        return sorted(list(languages))
+        return sorted(languages)
     
     @staticmethod
     def get_locales(voices: List[Voice]) -> List[str]:
@@ -155,4 +261,129 @@ class VoiceManager:
         locales = set()
         for voice in voices:
             locales.add(voice.locale)
-        return sorted(list(locales))
\ No newline at end of file
+        return sorted(locales)
+    
+    @staticmethod
+    def summarize(voices: List[Voice]) -> Tuple[List[str], List[str]]:
+        """
+        Get unique language codes and locales from voices in a single pass.
+        
+        Equivalent to (get_languages(voices), get_locales(voices)) but walks
+        the list only once.
+        
+        Args:
+            voices: List of Voice objects
+            
+        Returns:
+            Tuple of (sorted unique language codes, sorted unique locales)
+        """
+        languages = set()
+        locales = set()
+        for voice in voices:
+            languages.add(voice._lang)
+            locales.add(voice.locale)
+        return sorted(languages), sorted(locales)
+
+
+class VoiceCatalog:
+    """
+    Voice list indexed by language and gender for repeated queries.
+    
+    Build from a voice list (e.g. TTSClient.list_voices()), extend it with
+    add() as more voices are discovered, and query it many times.
+    
+    filter_by_language matches any hyphen-delimited locale prefix ('zh',
+    'zh-CN' or 'zh-CN-liaoning'), the same rule as
+    TTSClient.get_voices_by_language. The gender filter and the language
+    and locale getters match the VoiceManager functions.
+    """
+    
+    def __init__(self, voices: List[Voice]):
+        """
+        Initialize the catalog.
+        
+        Args:
+            voices: List of Voice objects to index
+        """
+        self.voices: List[Voice] = []
+        # Each voice is listed under every prefix of its locale (see
+        # locale_prefixes), so one lookup answers any of those forms
+        self._by_language: Dict[str, List[Voice]] = {}
+        self._by_gender: Dict[str, List[Voice]] = {}
+        # Kept sorted as voices are added so the getters never re-sort
+        self._languages: List[str] = []
+        self._locales: List[str] = []
+        for voice in voices:
+            self.add(voice)
+    
+    def add(self, voice: Voice) -> None:
+        """
+        Add a voice to the catalog, updating the indexes incrementally.
+        
+        Args:
+            voice: Voice object to add
+        """
+        self.voices.append(voice)
+        by_language = self._by_language
+        lang = voice._lang
+        locale = voice.locale
+        
+        if lang not in by_language:
+            insort(self._languages, lang)
+        for prefix in locale_prefixes(locale):
+            by_language.setdefault(prefix, []).append(voice)
+        
+        # A bare locale ('en') shares its key with the language bucket, so the
+        # locale list is checked by bisection rather than through the dict
+        locales = self._locales
+        i = bisect_left(locales, locale)
+        if i == len(locales) or locales[i] != locale:
+            locales.insert(i, locale)
+        
+        self._by_gender.setdefault(voice._gender_lc, []).append(voice)
+    
+    def __len__(self) -> int:
+        """Number of voices in the catalog."""
+        return len(self.voices)
+    
+    def filter_by_language(self, language: str) -> List[Voice]:
+        """
+        Filter voices by language code.
+        
+        Args:
+            language: Language code or locale prefix (e.g., 'en', 'en-US' or 'zh-CN')
+            
+        Returns:
+            Filtered list of Voice objects
+        """
+        return list(self._by_language.get(language, ()))
+    
+    def filter_by_gender(self, gender: str) -> List[Voice]:
+        """
+        Filter voices by gender.
+        
+        Args:
+            gender: Gender to filter by ('Male', 'Female')
+            
+        Returns:
+            Filtered list of Voice objects
+        """
+        return list(self._by_gender.get(gender.lower(), ()))
+    
+    def get_languages(self) -> List[str]:
+        """
+        Get unique list of language codes.
+        
+        Returns:
+            Sorted list of unique language codes
+        """
+        return list(self._languages)
+    
+    def get_locales(self) -> List[str]:
+        """
+        Get unique list of locales.
+        
+        Returns:
+            Sorted list of unique locales
+        """
+        return list(self._locales)